@@ -4,6 +4,7 @@ import (
 	"context"
 	"os"
 	"path/filepath"
+	"sync"
 	"testing"
 
 	"github.com/ludo-technologies/pyscn/domain"
@@ -12,6 +13,38 @@ import (
 	"github.com/stretchr/testify/require"
 )
 
+// parsedTestdataFile holds the outcome of reading and parsing one fixture.
+type parsedTestdataFile struct {
+	content  []byte
+	result   *parser.ParseResult
+	readErr  error
+	parseErr error
+}
+
+var (
+	parsedTestdataMu    sync.Mutex
+	parsedTestdataFiles = map[string]*parsedTestdataFile{}
+)
+
+// parseTestdataFile reads and parses a fixture once per test binary. Several
+// tests here walk the same testdata files; they only build CFGs from the AST
+// and never modify it, so sharing the parse result is safe.
+func parseTestdataFile(path string) *parsedTestdataFile {
+	parsedTestdataMu.Lock()
+	defer parsedTestdataMu.Unlock()
+
+	if parsed, ok := parsedTestdataFiles[path]; ok {
+		return parsed
+	}
+	parsed := &parsedTestdataFile{}
+	parsed.content, parsed.readErr = os.ReadFile(path)
+	if parsed.readErr == nil {
+		parsed.result, parsed.parseErr = parser.New().Parse(context.Background(), parsed.content)
+	}
+	parsedTestdataFiles[path] = parsed
+	return parsed
+}
+
 // TestCFGIntegrationWithRealFiles tests CFG construction with real Python files
 func TestCFGIntegrationWithRealFiles(t *testing.T) {
 	testdataPath := filepath.Join("..", "..", "testdata", "python")
@@ -75,9 +108,9 @@ func TestCFGIntegrationWithRealFiles(t *testing.T) {
 		t.Run(tc.file, func(t *testing.T) {
 			filePath := filepath.Join(testdataPath, tc.file)
 
-			// Read the file
-			content, err := os.ReadFile(filePath)
-			if err != nil {
+			// Read and parse the file
+			parsed := parseTestdataFile(filePath)
+			if err := parsed.readErr; err != nil {
 				if tc.shouldPass {
 					t.Fatalf("Failed to read test file %s: %v", tc.file, err)
 				} else {
@@ -86,10 +119,7 @@ func TestCFGIntegrationWithRealFiles(t *testing.T) {
 				}
 			}
 
-			// Parse the Python code
-			p := parser.New()
-			ctx := context.Background()
-			result, err := p.Parse(ctx, content)
+			result, err := parsed.result, parsed.parseErr
 			if err != nil && tc.shouldPass {
 				require.NoError(t, err, "Failed to parse %s: %s", tc.file, tc.description)
 			}
@@ -175,8 +205,9 @@ func TestCFGPerformanceWithRealFiles(t *testing.T) {
 	for _, file := range pythonFiles {
 		t.Run(filepath.Base(file), func(t *testing.T) {
 			// Read file
-			content, err := os.ReadFile(file)
-			require.NoError(t, err, "Failed to read file %s", file)
+			parsed := parseTestdataFile(file)
+			require.NoError(t, parsed.readErr, "Failed to read file %s", file)
+			content := parsed.content
 
 			// Skip very large files in performance tests
 			if len(content) > 50000 { // 50KB limit
@@ -185,14 +216,11 @@ func TestCFGPerformanceWithRealFiles(t *testing.T) {
 			}
 
 			// Parse
-			p := parser.New()
-			ctx := context.Background()
-			result, err := p.Parse(ctx, content)
-			if err != nil {
+			if parsed.parseErr != nil {
 				t.Logf("Skipping file with parse errors: %s", file)
 				return
 			}
-			ast := result.AST
+			ast := parsed.result.AST
 
 			// Build CFG and measure performance
 			builder := NewCFGBuilder()
@@ -0,0 +1,84 @@
+package analyzer
+
+import (
+	"encoding/json"
+	"flag"
+	"os"
+	"path/filepath"
+	"reflect"
+	"slices"
+	"sort"
+	"testing"
+
+	"github.com/ludo-technologies/pyscn/domain"
+)
+
+var updateCircularGolden = flag.Bool("update", false, "update circular dependency golden files")
+
+// circularDepsGolden is the expected cycle structure of a fixture project,
+// with modules sorted inside each cycle and cycles sorted by their modules.
+type circularDepsGolden struct {
+	TotalCycles          int        `json:"total_cycles"`
+	TotalModulesInCycles int        `json:"total_modules_in_cycles"`
+	Cycles               [][]string `json:"cycles"`
+}
+
+func TestCircularDepsFixtureGolden(t *testing.T) {
+	fixtureDir, err := filepath.Abs(filepath.Join("..", "..", "testdata", "python", "circular_deps"))
+	if err != nil {
+		t.Fatalf("failed to resolve fixture path: %v", err)
+	}
+
+	ma, err := NewModuleAnalyzer(&ModuleAnalysisOptions{
+		ProjectRoot:       fixtureDir,
+		IncludeStdLib:     domain.BoolPtr(false),
+		IncludeThirdParty: domain.BoolPtr(false),
+	})
+	if err != nil {
+		t.Fatalf("failed to create module analyzer: %v", err)
+	}
+	graph, err := ma.AnalyzeProject()
+	if err != nil {
+		t.Fatalf("failed to analyze fixture project: %v", err)
+	}
+
+	result := DetectCircularDependencies(graph)
+	got := circularDepsGolden{
+		TotalCycles:          result.TotalCycles,
+		TotalModulesInCycles: result.TotalModulesInCycles,
+	}
+	for _, cycle := range result.CircularDependencies {
+		modules := slices.Clone(cycle.Modules)
+		sort.Strings(modules)
+		got.Cycles = append(got.Cycles, modules)
+	}
+	sort.Slice(got.Cycles, func(i, j int) bool {
+		return slices.Compare(got.Cycles[i], got.Cycles[j]) < 0
+	})
+
+	goldenPath := filepath.Join("testdata", "golden", "circular_deps.json")
+	if *updateCircularGolden {
+		data, err := json.MarshalIndent(got, "", "  ")
+		if err != nil {
+			t.Fatalf("failed to encode golden file: %v", err)
+		}
+		if err := os.MkdirAll(filepath.Dir(goldenPath), 0o755); err != nil {
+			t.Fatalf("failed to create golden directory: %v", err)
+		}
+		if err := os.WriteFile(goldenPath, append(data, '\n'), 0o644); err != nil {
+			t.Fatalf("failed to write golden file: %v", err)
+		}
+	}
+
+	data, err := os.ReadFile(goldenPath)
+	if err != nil {
+		t.Fatalf("failed to read golden file: %v", err)
+	}
+	var want circularDepsGolden
+	if err := json.Unmarshal(data, &want); err != nil {
+		t.Fatalf("failed to decode golden file: %v", err)
+	}
+	if !reflect.DeepEqual(got, want) {
+		t.Errorf("cycles differ from %s (run with -update to refresh)\ngot:  %+v\nwant: %+v", goldenPath, got, want)
+	}
+}
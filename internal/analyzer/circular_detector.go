@@ -11,46 +11,99 @@ import (
 // CircularDependencyDetector enriches cycles detected by polyscan core.
 type CircularDependencyDetector struct {
 	graph      *DependencyGraph
+	loadTime   *loadTimeDependencyGraph
 	components [][]string // Strongly connected components
 }
 
+// loadTimeDependencyGraph is the load-time view of a DependencyGraph: lazy
+// imports are dropped because they cannot form load-time cycles. Module names
+// are interned to dense ids in sorted order and the adjacency is built once as
+// a CSR edge list, so cycle detection and chain search walk int32 slices
+// instead of re-filtering and re-sorting string sets on every visit.
 type loadTimeDependencyGraph struct {
 	*DependencyGraph
+
+	names   []string         // Module names indexed by id, sorted
+	ids     map[string]int32 // Module name -> id
+	offsets []int32          // Row i spans targets[offsets[i]:offsets[i+1]]
+	targets []int32          // Load-time successor ids, ascending per row
+
+	successorNames   [][]string
+	predecessorNames [][]string
 }
 
-// Successors excludes lazy imports because they cannot form load-time cycles.
-func (g loadTimeDependencyGraph) Successors(moduleName string) []string {
-	node := g.Nodes[moduleName]
-	if node == nil {
-		return nil
+func newLoadTimeDependencyGraph(graph *DependencyGraph) *loadTimeDependencyGraph {
+	names := graph.GetModuleNames()
+	ids := make(map[string]int32, len(names))
+	for i, name := range names {
+		ids[name] = int32(i)
 	}
 
-	dependencies := make([]string, 0, len(node.Dependencies))
-	for dependency := range node.Dependencies {
-		if !node.LazyDependencies[dependency] {
-			dependencies = append(dependencies, dependency)
+	offsets := make([]int32, len(names)+1)
+	targets := make([]int32, 0, graph.TotalEdges)
+	for i, name := range names {
+		start := len(targets)
+		node := graph.Nodes[name]
+		for dependency := range node.Dependencies {
+			if node.LazyDependencies[dependency] {
+				continue
+			}
+			if id, ok := ids[dependency]; ok {
+				targets = append(targets, id)
+			}
 		}
+		row := targets[start:]
+		sort.Slice(row, func(a, b int) bool { return row[a] < row[b] })
+		offsets[i+1] = int32(len(targets))
+	}
+
+	g := &loadTimeDependencyGraph{
+		DependencyGraph:  graph,
+		names:            names,
+		ids:              ids,
+		offsets:          offsets,
+		targets:          targets,
+		successorNames:   make([][]string, len(names)),
+		predecessorNames: make([][]string, len(names)),
+	}
+
+	// Rows are visited in id order, so predecessor lists come out sorted too
+	for from := range names {
+		row := g.successorIDs(int32(from))
+		successors := make([]string, len(row))
+		for k, to := range row {
+			successors[k] = names[to]
+			g.predecessorNames[to] = append(g.predecessorNames[to], names[from])
+		}
+		g.successorNames[from] = successors
+	}
+	for id, predecessors := range g.predecessorNames {
+		g.predecessorNames[id] = predecessors[:len(predecessors):len(predecessors)]
 	}
-	sort.Strings(dependencies)
-	return dependencies
+
+	return g
 }
 
-// Predecessors excludes modules whose edge to moduleName is a lazy import.
-func (g loadTimeDependencyGraph) Predecessors(moduleName string) []string {
-	node := g.Nodes[moduleName]
-	if node == nil {
+func (g *loadTimeDependencyGraph) successorIDs(id int32) []int32 {
+	return g.targets[g.offsets[id]:g.offsets[id+1]]
+}
+
+// Successors excludes lazy imports because they cannot form load-time cycles.
+func (g *loadTimeDependencyGraph) Successors(moduleName string) []string {
+	id, ok := g.ids[moduleName]
+	if !ok {
 		return nil
 	}
+	return g.successorNames[id]
+}
 
-	dependents := make([]string, 0, len(node.Dependents))
-	for dependent := range node.Dependents {
-		dependentNode := g.Nodes[dependent]
-		if dependentNode != nil && !dependentNode.LazyDependencies[moduleName] {
-			dependents = append(dependents, dependent)
-		}
+// Predecessors excludes modules whose edge to moduleName is a lazy import.
+func (g *loadTimeDependencyGraph) Predecessors(moduleName string) []string {
+	id, ok := g.ids[moduleName]
+	if !ok {
+		return nil
 	}
-	sort.Strings(dependents)
-	return dependents
+	return g.predecessorNames[id]
 }
 
 // CircularDependency represents a circular dependency relationship
@@ -108,7 +161,8 @@ func NewCircularDependencyDetector(graph *DependencyGraph) *CircularDependencyDe
 
 // DetectCircularDependencies detects all circular dependencies in the graph
 func (cdd *CircularDependencyDetector) DetectCircularDependencies() *CircularDependencyResult {
-	coreResult := coregraph.NewCycleDetector().DetectCycles(loadTimeDependencyGraph{cdd.graph})
+	cdd.loadTime = newLoadTimeDependencyGraph(cdd.graph)
+	coreResult := coregraph.NewCycleDetector().DetectCycles(cdd.loadTime)
 	cdd.components = coreResult.Cycles
 	for _, component := range cdd.components {
 		sort.Strings(component)
@@ -171,36 +225,40 @@ func (cdd *CircularDependencyDetector) processComponents() []*CircularDependency
 	return circularDeps
 }
 
-// findDependencyChains finds all dependency chains within a circular component
+// findDependencyChains finds all dependency chains within a circular component.
+// Only load-time edges are considered; lazy edges cannot close a cycle (#460).
 func (cdd *CircularDependencyDetector) findDependencyChains(modules []string) []DependencyChain {
 	var chains []DependencyChain
-	moduleSet := make(map[string]bool)
+	lt := cdd.loadTime
 
-	// Create module set for quick lookup
+	// Component membership by interned id
+	inComponent := make(map[int32]bool, len(modules))
 	for _, module := range modules {
-		moduleSet[module] = true
+		if id, ok := lt.ids[module]; ok {
+			inComponent[id] = true
+		}
 	}
 
 	// Find direct dependencies between modules in the component
 	for _, from := range modules {
-		if node := cdd.graph.Nodes[from]; node != nil {
-			for to := range node.Dependencies {
-				if node.LazyDependencies[to] {
-					continue // lazy edges are not load-time dependencies (#460)
-				}
-				if moduleSet[to] {
-					// Find the shortest path from 'from' to 'to' within the component
-					path := cdd.findPathInComponent(from, to, moduleSet)
-					if len(path) > 0 {
-						chain := DependencyChain{
-							From:   from,
-							To:     to,
-							Path:   path,
-							Length: len(path) - 1, // Number of edges
-						}
-						chains = append(chains, chain)
-					}
+		fromID, ok := lt.ids[from]
+		if !ok {
+			continue
+		}
+		for _, toID := range lt.successorIDs(fromID) {
+			if !inComponent[toID] {
+				continue
+			}
+			// Find the shortest path from 'from' to 'to' within the component
+			path := cdd.findPathInComponent(fromID, toID, inComponent)
+			if len(path) > 0 {
+				chain := DependencyChain{
+					From:   from,
+					To:     lt.names[toID],
+					Path:   path,
+					Length: len(path) - 1, // Number of edges
 				}
+				chains = append(chains, chain)
 			}
 		}
 	}
@@ -208,49 +266,49 @@ func (cdd *CircularDependencyDetector) findDependencyChains(modules []string) []
 	return chains
 }
 
-// findPathInComponent finds a path between two modules within a component
-func (cdd *CircularDependencyDetector) findPathInComponent(from, to string, moduleSet map[string]bool) []string {
+// findPathInComponent finds a shortest path between two modules within a component
+func (cdd *CircularDependencyDetector) findPathInComponent(from, to int32, inComponent map[int32]bool) []string {
+	lt := cdd.loadTime
 	if from == to {
-		return []string{from}
+		return []string{lt.names[from]}
 	}
 
-	// Simple BFS within the component
-	queue := [][]string{{from}}
-	visited := make(map[string]bool)
-	visited[from] = true
-
-	for len(queue) > 0 {
-		path := queue[0]
-		queue = queue[1:]
-		current := path[len(path)-1]
-
-		if node := cdd.graph.Nodes[current]; node != nil {
-			for dependency := range node.Dependencies {
-				if node.LazyDependencies[dependency] {
-					continue // lazy edges are not load-time dependencies (#460)
-				}
-				if !moduleSet[dependency] {
-					continue // Skip modules outside the component
-				}
-
-				if dependency == to {
-					return append(path, dependency)
-				}
-
-				if !visited[dependency] {
-					visited[dependency] = true
-					newPath := make([]string, len(path)+1)
-					copy(newPath, path)
-					newPath[len(path)] = dependency
-					queue = append(queue, newPath)
-				}
+	// BFS within the component, recording parents instead of copying paths
+	parent := map[int32]int32{from: -1}
+	queue := []int32{from}
+	for head := 0; head < len(queue); head++ {
+		current := queue[head]
+		for _, next := range lt.successorIDs(current) {
+			if !inComponent[next] {
+				continue // Skip modules outside the component
+			}
+			if _, seen := parent[next]; seen {
+				continue
 			}
+			parent[next] = current
+			if next == to {
+				return lt.pathTo(to, parent)
+			}
+			queue = append(queue, next)
 		}
 	}
 
 	return nil // No path found
 }
 
+// pathTo rebuilds the module path ending at id from BFS parent links.
+func (g *loadTimeDependencyGraph) pathTo(id int32, parent map[int32]int32) []string {
+	var reversed []int32
+	for ; id >= 0; id = parent[id] {
+		reversed = append(reversed, id)
+	}
+	path := make([]string, len(reversed))
+	for i, step := range reversed {
+		path[len(reversed)-1-i] = g.names[step]
+	}
+	return path
+}
+
 // assessCycleSeverity determines the severity of a circular dependency
 func (cdd *CircularDependencyDetector) assessCycleSeverity(cycle *CircularDependency) CycleSeverity {
 	size := cycle.Size
@@ -396,45 +454,39 @@ func HasCircularDependencies(graph *DependencyGraph) bool {
 func FindSimpleCycles(graph *DependencyGraph) []*CircularDependency {
 	var simpleCycles []*CircularDependency
 
-	// Check each pair of modules for mutual dependencies
-	modules := graph.GetModuleNames()
-	for i, moduleA := range modules {
-		nodeA := graph.Nodes[moduleA]
-		if nodeA == nil {
-			continue
-		}
-
-		for j := i + 1; j < len(modules); j++ {
-			moduleB := modules[j]
-			nodeB := graph.Nodes[moduleB]
-			if nodeB == nil {
+	// Check each load-time edge A -> B (A < B) for the reverse edge B -> A.
+	// Lazy (function-body) imports are excluded: they cannot form a load-time
+	// cycle. See issue #460. Visiting edges instead of all module pairs keeps
+	// this linear in the number of imports.
+	lt := newLoadTimeDependencyGraph(graph)
+	for a, moduleA := range lt.names {
+		for _, b := range lt.successorIDs(int32(a)) {
+			if b <= int32(a) || !hasSortedID(lt.successorIDs(b), int32(a)) {
 				continue
 			}
-
-			// Check if A depends on B and B depends on A at load time.
-			// Lazy (function-body) imports are excluded: they cannot form a
-			// load-time cycle. See issue #460.
-			aToB := nodeA.Dependencies[moduleB] && !nodeA.LazyDependencies[moduleB]
-			bToA := nodeB.Dependencies[moduleA] && !nodeB.LazyDependencies[moduleA]
-			if aToB && bToA {
-				cycle := &CircularDependency{
-					Modules:     []string{moduleA, moduleB},
-					Size:        2,
-					Severity:    CycleSeverityLow,
-					Description: fmt.Sprintf("Direct circular dependency between %s and %s", moduleA, moduleB),
-					Dependencies: []DependencyChain{
-						{From: moduleA, To: moduleB, Path: []string{moduleA, moduleB}, Length: 1},
-						{From: moduleB, To: moduleA, Path: []string{moduleB, moduleA}, Length: 1},
-					},
-				}
-				simpleCycles = append(simpleCycles, cycle)
+			moduleB := lt.names[b]
+			cycle := &CircularDependency{
+				Modules:     []string{moduleA, moduleB},
+				Size:        2,
+				Severity:    CycleSeverityLow,
+				Description: fmt.Sprintf("Direct circular dependency between %s and %s", moduleA, moduleB),
+				Dependencies: []DependencyChain{
+					{From: moduleA, To: moduleB, Path: []string{moduleA, moduleB}, Length: 1},
+					{From: moduleB, To: moduleA, Path: []string{moduleB, moduleA}, Length: 1},
+				},
 			}
+			simpleCycles = append(simpleCycles, cycle)
 		}
 	}
 
 	return simpleCycles
 }
 
+func hasSortedID(ids []int32, id int32) bool {
+	i := sort.Search(len(ids), func(k int) bool { return ids[k] >= id })
+	return i < len(ids) && ids[i] == id
+}
+
 // GetCycleBreakingSuggestions suggests module refactoring to break cycles
 func GetCycleBreakingSuggestions(result *CircularDependencyResult) []string {
 	if !result.HasCircularDependencies {
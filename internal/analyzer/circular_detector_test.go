@@ -0,0 +1,86 @@
+package analyzer
+
+import (
+	"path/filepath"
+	"reflect"
+	"testing"
+)
+
+func buildTestDependencyGraph(edges [][2]string, lazy ...[2]string) *DependencyGraph {
+	graph := NewDependencyGraph("/project")
+	addModule := func(name string) {
+		graph.AddModule(name, filepath.Join("/project", name+".py"))
+	}
+	for _, edge := range append(edges, lazy...) {
+		addModule(edge[0])
+		addModule(edge[1])
+	}
+	for _, edge := range edges {
+		graph.AddDependency(edge[0], edge[1], DependencyEdgeImport, &ImportInfo{})
+	}
+	for _, edge := range lazy {
+		graph.AddDependency(edge[0], edge[1], DependencyEdgeImport, &ImportInfo{IsLazy: true})
+	}
+	return graph
+}
+
+func TestLoadTimeDependencyGraphAdjacency(t *testing.T) {
+	graph := buildTestDependencyGraph(
+		[][2]string{{"a", "c"}, {"a", "b"}, {"b", "c"}},
+		[2]string{"c", "a"},
+	)
+	lt := newLoadTimeDependencyGraph(graph)
+
+	if got := lt.Successors("a"); !reflect.DeepEqual(got, []string{"b", "c"}) {
+		t.Errorf("Successors(a) = %v, want [b c]", got)
+	}
+	if got := lt.Successors("c"); len(got) != 0 {
+		t.Errorf("Successors(c) = %v, want none (lazy edge)", got)
+	}
+	if got := lt.Predecessors("c"); !reflect.DeepEqual(got, []string{"a", "b"}) {
+		t.Errorf("Predecessors(c) = %v, want [a b]", got)
+	}
+	if got := lt.Successors("missing"); got != nil {
+		t.Errorf("Successors(missing) = %v, want nil", got)
+	}
+}
+
+func TestDetectCircularDependenciesChains(t *testing.T) {
+	graph := buildTestDependencyGraph([][2]string{
+		{"a", "b"}, {"b", "c"}, {"c", "a"}, // 3-module cycle
+		{"c", "d"}, // leaves the cycle
+	})
+
+	result := DetectCircularDependencies(graph)
+	if result.TotalCycles != 1 {
+		t.Fatalf("TotalCycles = %d, want 1", result.TotalCycles)
+	}
+
+	cycle := result.CircularDependencies[0]
+	if !reflect.DeepEqual(cycle.Modules, []string{"a", "b", "c"}) {
+		t.Errorf("Modules = %v, want [a b c]", cycle.Modules)
+	}
+	if len(cycle.Dependencies) != 3 {
+		t.Fatalf("expected 3 chains inside the cycle, got %+v", cycle.Dependencies)
+	}
+	for _, chain := range cycle.Dependencies {
+		if chain.Length != 1 || len(chain.Path) != 2 || chain.Path[0] != chain.From || chain.Path[1] != chain.To {
+			t.Errorf("unexpected chain %+v", chain)
+		}
+	}
+}
+
+func TestFindSimpleCycles(t *testing.T) {
+	graph := buildTestDependencyGraph(
+		[][2]string{{"a", "b"}, {"b", "a"}, {"c", "d"}, {"x", "y"}},
+		[2]string{"d", "c"},
+	)
+
+	cycles := FindSimpleCycles(graph)
+	if len(cycles) != 1 {
+		t.Fatalf("expected 1 simple cycle, got %d", len(cycles))
+	}
+	if !reflect.DeepEqual(cycles[0].Modules, []string{"a", "b"}) {
+		t.Errorf("Modules = %v, want [a b]", cycles[0].Modules)
+	}
+}
@@ -1,6 +1,7 @@
 package analyzer
 
 import (
+	"sort"
 	"strings"
 	"time"
 
@@ -87,6 +88,18 @@ type DeadCodeResult struct {
 type DeadCodeDetector struct {
 	cfg      *CFG
 	filePath string // File path for context in findings
+
+	// terminators lists the blocks ending control flow, built once on first
+	// use so classifying each dead block does not rescan every statement.
+	terminators      []blockTerminator
+	terminatorsBuilt bool
+}
+
+// blockTerminator records a block containing a return/break/continue/raise.
+type blockTerminator struct {
+	block   *BasicBlock
+	endLine int
+	reason  DeadCodeReason
 }
 
 // NewDeadCodeDetector creates a new dead code detector for the given CFG
@@ -211,7 +224,8 @@ func (dcd *DeadCodeDetector) analyzeCoreDeadBlock(block *BasicBlock, coreReason
 		return findings
 	}
 
-	reason, severity := dcd.determineDeadCodeReason(block)
+	var reason DeadCodeReason
+	var severity SeverityLevel
 	switch coreReason {
 	case "after_return":
 		reason, severity = ReasonUnreachableAfterReturn, SeverityLevelCritical
@@ -221,6 +235,8 @@ func (dcd *DeadCodeDetector) analyzeCoreDeadBlock(block *BasicBlock, coreReason
 		reason, severity = ReasonUnreachableAfterContinue, SeverityLevelCritical
 	case "after_throw":
 		reason, severity = ReasonUnreachableAfterRaise, SeverityLevelCritical
+	default:
+		reason, severity = dcd.determineDeadCodeReason(block)
 	}
 
 	// Create a finding for this dead block
@@ -267,28 +283,17 @@ func (dcd *DeadCodeDetector) findTerminatorInPredecessors(block *BasicBlock) (De
 	// This handles cases where CFG edges might not be perfectly set up
 	blockStartLine := dcd.getBlockStartLine(block)
 
-	for _, otherBlock := range dcd.cfg.Blocks {
-		if otherBlock == nil || otherBlock == block {
+	// Terminator blocks are ordered by descending end line, so the nearest
+	// one ending before this block is found first
+	for _, terminator := range dcd.terminatorBlocks() {
+		if terminator.endLine >= blockStartLine || terminator.block == block {
 			continue
 		}
-
-		otherEndLine := dcd.getBlockEndLine(otherBlock)
-
-		// Check if the other block ends before this block starts (sequential in source)
-		if otherEndLine < blockStartLine && (blockStartLine-otherEndLine) <= 5 {
-			if dcd.blockContainsReturn(otherBlock) {
-				return ReasonUnreachableAfterReturn, SeverityLevelCritical
-			}
-			if dcd.blockContainsBreak(otherBlock) {
-				return ReasonUnreachableAfterBreak, SeverityLevelCritical
-			}
-			if dcd.blockContainsContinue(otherBlock) {
-				return ReasonUnreachableAfterContinue, SeverityLevelCritical
-			}
-			if dcd.blockContainsRaise(otherBlock) {
-				return ReasonUnreachableAfterRaise, SeverityLevelCritical
-			}
+		// Check if the terminator ends just before this block starts (sequential in source)
+		if blockStartLine-terminator.endLine > 5 {
+			break
 		}
+		return terminator.reason, SeverityLevelCritical
 	}
 
 	// Secondary check: use CFG edges if available
@@ -297,34 +302,62 @@ func (dcd *DeadCodeDetector) findTerminatorInPredecessors(block *BasicBlock) (De
 			continue
 		}
 
-		predBlock := predEdge.From
-
 		// Check for terminator statements in predecessor block
-		if dcd.blockContainsReturn(predBlock) {
-			if dcd.isSequentiallyAfter(predBlock, block) {
-				return ReasonUnreachableAfterReturn, SeverityLevelCritical
-			}
-		}
-		if dcd.blockContainsBreak(predBlock) {
-			if dcd.isSequentiallyAfter(predBlock, block) {
-				return ReasonUnreachableAfterBreak, SeverityLevelCritical
-			}
-		}
-		if dcd.blockContainsContinue(predBlock) {
-			if dcd.isSequentiallyAfter(predBlock, block) {
-				return ReasonUnreachableAfterContinue, SeverityLevelCritical
-			}
-		}
-		if dcd.blockContainsRaise(predBlock) {
-			if dcd.isSequentiallyAfter(predBlock, block) {
-				return ReasonUnreachableAfterRaise, SeverityLevelCritical
-			}
+		predBlock := predEdge.From
+		if reason := dcd.blockTerminatorReason(predBlock); reason != "" && dcd.isSequentiallyAfter(predBlock, block) {
+			return reason, SeverityLevelCritical
 		}
 	}
 
 	return "", SeverityLevelWarning
 }
 
+// terminatorBlocks returns the blocks of the CFG that contain a terminator
+// statement, ordered by descending end line.
+func (dcd *DeadCodeDetector) terminatorBlocks() []blockTerminator {
+	if dcd.terminatorsBuilt {
+		return dcd.terminators
+	}
+	dcd.terminatorsBuilt = true
+
+	for _, block := range dcd.cfg.Blocks {
+		if block == nil {
+			continue
+		}
+		if reason := dcd.blockTerminatorReason(block); reason != "" {
+			dcd.terminators = append(dcd.terminators, blockTerminator{
+				block:   block,
+				endLine: dcd.getBlockEndLine(block),
+				reason:  reason,
+			})
+		}
+	}
+	sort.Slice(dcd.terminators, func(i, j int) bool {
+		a, b := dcd.terminators[i], dcd.terminators[j]
+		if a.endLine != b.endLine {
+			return a.endLine > b.endLine
+		}
+		return a.block.ID < b.block.ID
+	})
+	return dcd.terminators
+}
+
+// blockTerminatorReason returns the dead code reason implied by the first
+// kind of terminator found in a block: return, break, continue, then raise.
+func (dcd *DeadCodeDetector) blockTerminatorReason(block *BasicBlock) DeadCodeReason {
+	switch {
+	case dcd.blockContainsReturn(block):
+		return ReasonUnreachableAfterReturn
+	case dcd.blockContainsBreak(block):
+		return ReasonUnreachableAfterBreak
+	case dcd.blockContainsContinue(block):
+		return ReasonUnreachableAfterContinue
+	case dcd.blockContainsRaise(block):
+		return ReasonUnreachableAfterRaise
+	}
+	return ""
+}
+
 // blockContainsReturn checks if a block contains a return statement
 func (dcd *DeadCodeDetector) blockContainsReturn(block *BasicBlock) bool {
 	classifier := pythonCFGClassifier{}
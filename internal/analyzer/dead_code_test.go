@@ -715,6 +715,37 @@ def g(y):
 	}
 }
 
+func TestDeadCodeTerminatorBlocksAreNearestFirst(t *testing.T) {
+	code := `
+def f(items):
+    for item in items:
+        if item:
+            continue
+        if item is None:
+            break
+    return items
+`
+
+	p := parser.New()
+	parseResult, err := p.Parse(context.Background(), []byte(code))
+	require.NoError(t, err)
+
+	cfgs, err := NewCFGBuilder().BuildAll(parseResult.AST)
+	require.NoError(t, err)
+	cfg, ok := cfgs["f"]
+	require.True(t, ok)
+
+	detector := NewDeadCodeDetector(cfg)
+	terminators := detector.terminatorBlocks()
+	require.Len(t, terminators, 3)
+	assert.Equal(t, ReasonUnreachableAfterReturn, terminators[0].reason)
+	assert.Equal(t, ReasonUnreachableAfterBreak, terminators[1].reason)
+	assert.Equal(t, ReasonUnreachableAfterContinue, terminators[2].reason)
+	for i := 1; i < len(terminators); i++ {
+		assert.GreaterOrEqual(t, terminators[i-1].endLine, terminators[i].endLine)
+	}
+}
+
 func TestDeadCodeNoOverlappingFindings(t *testing.T) {
 	// A compound statement (if) spans its body, so the body's own block used to
 	// emit a finding whose range was nested inside the if's finding range,
@@ -0,0 +1,220 @@
+package analyzer
+
+import (
+	"math/bits"
+	"sort"
+)
+
+// denseReachabilityMaxModules is the largest graph whose closure is
+// precomputed as bit rows. Rows take components*modules/64 words, which grows
+// quadratically on mostly acyclic graphs, so larger graphs walk on demand.
+const denseReachabilityMaxModules = 4096
+
+// DependencyReachability answers transitive dependency queries for a
+// DependencyGraph. Modules are interned to dense ids. For graphs of up to
+// denseReachabilityMaxModules modules, every strongly connected component
+// stores the set of modules it reaches as one packed bit row, so the closure
+// is built with word-wide ORs and a query scans len(modules)/64 words instead
+// of walking the graph again. Larger graphs are walked per query, keeping
+// memory proportional to the reach set of the module being queried.
+type DependencyReachability struct {
+	names      []string       // Sorted module names; the index is the module id
+	ids        map[string]int // Module name -> id
+	successors [][]int        // Module id -> ids of its direct dependencies
+	component  []int          // Module id -> component index; nil when walking
+	words      int            // uint64 words per row
+	rows       []uint64       // Reach set of each component, words per row
+}
+
+// NewDependencyReachability computes the transitive closure of graph.
+func NewDependencyReachability(graph *DependencyGraph) *DependencyReachability {
+	return newDependencyReachability(graph, denseReachabilityMaxModules)
+}
+
+func newDependencyReachability(graph *DependencyGraph, denseMaxModules int) *DependencyReachability {
+	names := graph.GetModuleNames()
+	ids := make(map[string]int, len(names))
+	for id, name := range names {
+		ids[name] = id
+	}
+	successors := make([][]int, len(names))
+	for id, name := range names {
+		for dep := range graph.Nodes[name].Dependencies {
+			if depID, ok := ids[dep]; ok {
+				successors[id] = append(successors[id], depID)
+			}
+		}
+	}
+
+	r := &DependencyReachability{
+		names:      names,
+		ids:        ids,
+		successors: successors,
+	}
+	if len(names) > denseMaxModules {
+		return r
+	}
+
+	r.words = (len(names) + 63) / 64
+	var components [][]int
+	r.component, components = stronglyConnectedComponents(successors)
+	r.rows = make([]uint64, len(components)*r.words)
+
+	// Components come out of Tarjan's algorithm in reverse topological
+	// order, so every component a row depends on is complete before it.
+	merged := make([]int, len(components))
+	for c := range merged {
+		merged[c] = -1
+	}
+	for c, members := range components {
+		row := r.row(c)
+		for _, m := range members {
+			row[m>>6] |= 1 << (m & 63)
+			for _, s := range successors[m] {
+				sc := r.component[s]
+				if sc == c || merged[sc] == c {
+					continue
+				}
+				merged[sc] = c
+				for w, word := range r.row(sc) {
+					row[w] |= word
+				}
+			}
+		}
+	}
+	return r
+}
+
+func (r *DependencyReachability) row(c int) []uint64 {
+	return r.rows[c*r.words : (c+1)*r.words]
+}
+
+// TransitiveDependencies returns the modules moduleName depends on directly
+// or indirectly, sorted by name and excluding moduleName itself. Returns nil
+// for unknown modules and modules without dependencies.
+func (r *DependencyReachability) TransitiveDependencies(moduleName string) []string {
+	id, ok := r.ids[moduleName]
+	if !ok {
+		return nil
+	}
+	if r.component == nil {
+		return r.walkDependencies(id)
+	}
+
+	var deps []string
+	for w, word := range r.row(r.component[id]) {
+		for word != 0 {
+			dep := w<<6 | bits.TrailingZeros64(word)
+			word &= word - 1
+			if dep != id {
+				deps = append(deps, r.names[dep])
+			}
+		}
+	}
+	return deps
+}
+
+// walkDependencies collects the modules reachable from id with a graph walk.
+// Ids follow name order, so sorting them sorts the names.
+func (r *DependencyReachability) walkDependencies(id int) []string {
+	visited := map[int]bool{id: true}
+	queue := []int{id}
+	var reached []int
+	for len(queue) > 0 {
+		current := queue[0]
+		queue = queue[1:]
+		for _, dep := range r.successors[current] {
+			if !visited[dep] {
+				visited[dep] = true
+				reached = append(reached, dep)
+				queue = append(queue, dep)
+			}
+		}
+	}
+	if len(reached) == 0 {
+		return nil
+	}
+
+	sort.Ints(reached)
+	deps := make([]string, len(reached))
+	for i, dep := range reached {
+		deps[i] = r.names[dep]
+	}
+	return deps
+}
+
+// stronglyConnectedComponents runs an iterative Tarjan's algorithm over a
+// graph given as successor lists. It returns the component index of each
+// node and the members of each component, in reverse topological order.
+func stronglyConnectedComponents(successors [][]int) ([]int, [][]int) {
+	type frame struct {
+		node int
+		edge int // Next successor to visit
+	}
+
+	n := len(successors)
+	index := make([]int, n)
+	lowlink := make([]int, n)
+	onStack := make([]bool, n)
+	component := make([]int, n)
+	for i := range index {
+		index[i] = -1
+	}
+
+	var components [][]int
+	var stack []int
+	var callStack []frame
+	next := 0
+	visit := func(v int) {
+		index[v], lowlink[v] = next, next
+		next++
+		stack = append(stack, v)
+		onStack[v] = true
+		callStack = append(callStack, frame{node: v})
+	}
+
+	for root := range n {
+		if index[root] >= 0 {
+			continue
+		}
+		visit(root)
+		for len(callStack) > 0 {
+			top := &callStack[len(callStack)-1]
+			v := top.node
+			if top.edge < len(successors[v]) {
+				w := successors[v][top.edge]
+				top.edge++
+				if index[w] < 0 {
+					visit(w)
+				} else if onStack[w] {
+					lowlink[v] = min(lowlink[v], index[w])
+				}
+				continue
+			}
+
+			callStack = callStack[:len(callStack)-1]
+			if len(callStack) > 0 {
+				parent := callStack[len(callStack)-1].node
+				lowlink[parent] = min(lowlink[parent], lowlink[v])
+			}
+			if lowlink[v] != index[v] {
+				continue
+			}
+
+			c := len(components)
+			var members []int
+			for {
+				w := stack[len(stack)-1]
+				stack = stack[:len(stack)-1]
+				onStack[w] = false
+				component[w] = c
+				members = append(members, w)
+				if w == v {
+					break
+				}
+			}
+			components = append(components, members)
+		}
+	}
+	return component, components
+}
@@ -0,0 +1,81 @@
+package analyzer
+
+import (
+	"fmt"
+	"math/rand"
+	"reflect"
+	"sort"
+	"testing"
+)
+
+func TestDependencyReachability(t *testing.T) {
+	graph := buildTestDependencyGraph(
+		[][2]string{
+			{"a", "b"}, {"b", "c"}, {"c", "b"},
+			{"c", "d"},
+			{"e", "a"},
+		},
+		[2]string{"d", "a"}, // Lazy edges still count, closing a -> b -> c -> d -> a
+	)
+
+	tests := map[string][]string{
+		"a": {"b", "c", "d"},
+		"b": {"a", "c", "d"},
+		"d": {"a", "b", "c"},
+		"e": {"a", "b", "c", "d"},
+	}
+	// A limit of 0 forces the per-query walk used for large graphs
+	for _, denseMax := range []int{denseReachabilityMaxModules, 0} {
+		r := newDependencyReachability(graph, denseMax)
+		for module, want := range tests {
+			if got := r.TransitiveDependencies(module); !reflect.DeepEqual(got, want) {
+				t.Errorf("dense limit %d: TransitiveDependencies(%s) = %v, want %v", denseMax, module, got, want)
+			}
+		}
+		if got := r.TransitiveDependencies("missing"); got != nil {
+			t.Errorf("dense limit %d: TransitiveDependencies(missing) = %v, want nil", denseMax, got)
+		}
+	}
+}
+
+func TestDependencyReachabilityMatchesGraphWalk(t *testing.T) {
+	// More than 64 modules so reach sets span several words
+	rng := rand.New(rand.NewSource(1))
+	var edges [][2]string
+	for i := 0; i < 300; i++ {
+		from, to := rng.Intn(150), rng.Intn(150)
+		if from != to {
+			edges = append(edges, [2]string{fmt.Sprintf("m%03d", from), fmt.Sprintf("m%03d", to)})
+		}
+	}
+	graph := buildTestDependencyGraph(edges)
+	dense := NewDependencyReachability(graph)
+	walked := newDependencyReachability(graph, 0)
+
+	for _, module := range graph.GetModuleNames() {
+		visited := map[string]bool{module: true}
+		queue := []string{module}
+		var want []string
+		for len(queue) > 0 {
+			current := queue[0]
+			queue = queue[1:]
+			for dep := range graph.Nodes[current].Dependencies {
+				if !visited[dep] {
+					visited[dep] = true
+					want = append(want, dep)
+					queue = append(queue, dep)
+				}
+			}
+		}
+		sort.Strings(want)
+		if len(want) == 0 {
+			want = nil
+		}
+		if got := dense.TransitiveDependencies(module); !reflect.DeepEqual(got, want) {
+			t.Fatalf("dense TransitiveDependencies(%s) = %v, want %v", module, got, want)
+		}
+		if got := walked.TransitiveDependencies(module); !reflect.DeepEqual(got, want) {
+			t.Fatalf("walked TransitiveDependencies(%s) = %v, want %v", module, got, want)
+		}
+	}
+}
@@ -0,0 +1,54 @@
+package analyzer
+
+import "container/list"
+
+// lruCache is a map bounded to a fixed number of entries that evicts the least
+// recently used entry when full. Eviction depends only on access order, so
+// repeated runs over the same input behave identically. Not safe for
+// concurrent use.
+type lruCache[K comparable, V any] struct {
+	capacity int
+	items    map[K]*list.Element
+	order    *list.List // Front is the most recently used entry
+}
+
+type lruEntry[K comparable, V any] struct {
+	key   K
+	value V
+}
+
+// newLRUCache creates a cache holding at most capacity entries. A capacity
+// <= 0 leaves the cache unbounded.
+func newLRUCache[K comparable, V any](capacity int) *lruCache[K, V] {
+	return &lruCache[K, V]{
+		capacity: capacity,
+		items:    make(map[K]*list.Element),
+		order:    list.New(),
+	}
+}
+
+// get returns the value stored for key and marks it as most recently used.
+func (c *lruCache[K, V]) get(key K) (V, bool) {
+	if elem, ok := c.items[key]; ok {
+		c.order.MoveToFront(elem)
+		return elem.Value.(*lruEntry[K, V]).value, true
+	}
+	var zero V
+	return zero, false
+}
+
+// add stores value for key, evicting the least recently used entry if the
+// cache is full.
+func (c *lruCache[K, V]) add(key K, value V) {
+	if elem, ok := c.items[key]; ok {
+		elem.Value.(*lruEntry[K, V]).value = value
+		c.order.MoveToFront(elem)
+		return
+	}
+	c.items[key] = c.order.PushFront(&lruEntry[K, V]{key: key, value: value})
+	if c.capacity > 0 && c.order.Len() > c.capacity {
+		oldest := c.order.Back()
+		c.order.Remove(oldest)
+		delete(c.items, oldest.Value.(*lruEntry[K, V]).key)
+	}
+}
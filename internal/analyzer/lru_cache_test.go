@@ -0,0 +1,39 @@
+package analyzer
+
+import "testing"
+
+func TestLRUCacheEvictsLeastRecentlyUsed(t *testing.T) {
+	cache := newLRUCache[string, int](2)
+	cache.add("a", 1)
+	cache.add("b", 2)
+
+	// Touch "a" so "b" becomes the eviction candidate
+	if v, ok := cache.get("a"); !ok || v != 1 {
+		t.Fatalf("get(a) = %d, %v; want 1, true", v, ok)
+	}
+	cache.add("c", 3)
+
+	if _, ok := cache.get("b"); ok {
+		t.Errorf("expected b to be evicted")
+	}
+	if v, ok := cache.get("c"); !ok || v != 3 {
+		t.Errorf("get(c) = %d, %v; want 3, true", v, ok)
+	}
+	if cache.order.Len() != 2 {
+		t.Errorf("cache holds %d entries, want 2", cache.order.Len())
+	}
+}
+
+func TestLRUCacheUpdateAndUnbounded(t *testing.T) {
+	cache := newLRUCache[int, string](0)
+	for i := 0; i < 100; i++ {
+		cache.add(i, "x")
+	}
+	cache.add(0, "y")
+	if cache.order.Len() != 100 {
+		t.Errorf("cache holds %d entries, want 100 for an unbounded cache", cache.order.Len())
+	}
+	if v, _ := cache.get(0); v != "y" {
+		t.Errorf("get(0) = %q, want updated value", v)
+	}
+}
@@ -5,8 +5,10 @@ import (
 	"fmt"
 	"os"
 	"path/filepath"
+	"runtime"
 	"sort"
 	"strings"
+	"sync"
 
 	"github.com/bmatcuk/doublestar/v4"
 	"github.com/ludo-technologies/pyscn/domain"
@@ -27,6 +29,9 @@ type ModuleAnalyzer struct {
 	// Re-export resolution
 	reExportResolver *ReExportResolver // Resolves re-exports in __init__.py files
 
+	// Per-file facts cache keyed by content fingerprint (nil when disabled)
+	factsCache *moduleFactsCache
+
 	// Analysis options
 	includeStdLib     bool
 	includeThirdParty bool
@@ -182,12 +187,14 @@ func (ma *ModuleAnalyzer) AnalyzeProject() (*DependencyGraph, error) {
 	}
 
 	// Second pass: Analyze dependencies for each module
-	for _, filePath := range files {
-		if err := ma.analyzeModuleDependencies(graph, filePath); err != nil {
+	ma.factsCache = loadModuleFactsCache(ma.projectRoot)
+	for i, loaded := range ma.loadModuleFacts(files) {
+		if err := ma.analyzeModuleDependencies(graph, files[i], loaded); err != nil {
 			// Log warning but continue with other files
 			continue
 		}
 	}
+	ma.factsCache.save()
 
 	return graph, nil
 }
@@ -221,30 +228,73 @@ func (ma *ModuleAnalyzer) AnalyzeFiles(filePaths []string) (*DependencyGraph, er
 	}
 
 	// Analyze dependencies
-	for _, filePath := range validFiles {
-		if err := ma.analyzeModuleDependencies(graph, filePath); err != nil {
+	ma.factsCache = loadModuleFactsCache(ma.projectRoot)
+	for i, loaded := range ma.loadModuleFacts(validFiles) {
+		if err := ma.analyzeModuleDependencies(graph, validFiles[i], loaded); err != nil {
 			continue
 		}
 	}
+	ma.factsCache.save()
 
 	return graph, nil
 }
 
-// analyzeModuleDependencies analyzes imports in a single module and adds dependencies to graph
-func (ma *ModuleAnalyzer) analyzeModuleDependencies(graph *DependencyGraph, filePath string) error {
-	// Read file content
-	content, err := os.ReadFile(filePath)
-	if err != nil {
-		return fmt.Errorf("failed to read file %s: %w", filePath, err)
+// loadedModuleFacts is the outcome of reading one file for the second pass.
+type loadedModuleFacts struct {
+	facts     moduleFacts
+	lineCount int
+	err       error
+}
+
+// parallelModuleFactsMinFiles is the file count from which loadModuleFacts
+// spreads reading, hashing, and parsing over worker goroutines. Smaller
+// inputs are handled serially, where worker setup would outweigh the gain.
+const parallelModuleFactsMinFiles = 32
+
+// loadModuleFacts extracts the facts of every file, in parallel for larger
+// inputs. Results are returned in input order so the dependency graph is
+// built deterministically.
+func (ma *ModuleAnalyzer) loadModuleFacts(files []string) []loadedModuleFacts {
+	results := make([]loadedModuleFacts, len(files))
+	load := func(i int) {
+		facts, lineCount, err := ma.moduleFactsForFile(files[i])
+		results[i] = loadedModuleFacts{facts: facts, lineCount: lineCount, err: err}
+	}
+
+	workerCount := min(len(files), runtime.GOMAXPROCS(0))
+	if len(files) < parallelModuleFactsMinFiles || workerCount <= 1 {
+		for i := range files {
+			load(i)
+		}
+		return results
+	}
+
+	jobs := make(chan int)
+	var wg sync.WaitGroup
+	for range workerCount {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			for i := range jobs {
+				load(i)
+			}
+		}()
+	}
+	for i := range files {
+		jobs <- i
 	}
+	close(jobs)
+	wg.Wait()
 
-	// Parse the Python file
-	p := parser.New()
-	ctx := context.Background()
-	result, err := p.Parse(ctx, content)
-	if err != nil {
-		return fmt.Errorf("failed to parse file %s: %w", filePath, err)
+	return results
+}
+
+// analyzeModuleDependencies adds the dependencies of a single module to graph
+func (ma *ModuleAnalyzer) analyzeModuleDependencies(graph *DependencyGraph, filePath string, loaded loadedModuleFacts) error {
+	if loaded.err != nil {
+		return loaded.err
 	}
+	facts, lineCount := loaded.facts, loaded.lineCount
 
 	moduleName := ma.filePathToModuleName(filePath)
 	if moduleName == "" {
@@ -257,12 +307,11 @@ func (ma *ModuleAnalyzer) analyzeModuleDependencies(graph *DependencyGraph, file
 		return fmt.Errorf("module not found in graph: %s", moduleName)
 	}
 
-	facts := ma.collectModuleFacts(result.AST)
 	module.FunctionCount = facts.functionCount
 	module.ClassCount = facts.classCount
 	module.AbstractClassCount = facts.abstractClassCount
 	module.PublicNames = facts.publicNames
-	module.LineCount = countSourceLines(content)
+	module.LineCount = lineCount
 
 	// Process each import
 	for _, imp := range facts.imports {
@@ -297,6 +346,59 @@ func (ma *ModuleAnalyzer) analyzeModuleDependencies(graph *DependencyGraph, file
 	return nil
 }
 
+// moduleFactsForFile returns the facts and line count for a file. When the
+// file's size and modification time match the facts cache, its content is
+// not read at all.
+func (ma *ModuleAnalyzer) moduleFactsForFile(filePath string) (moduleFacts, int, error) {
+	var info os.FileInfo
+	if ma.factsCache != nil {
+		if stat, err := os.Stat(filePath); err == nil {
+			info = stat
+			if fingerprint, ok := ma.factsCache.fingerprintForStat(filePath, info); ok {
+				if facts, lineCount, ok := ma.factsCache.lookup(fingerprint); ok {
+					return facts, lineCount, nil
+				}
+			}
+		}
+	}
+
+	// Read file content
+	content, err := os.ReadFile(filePath)
+	if err != nil {
+		return moduleFacts{}, 0, fmt.Errorf("failed to read file %s: %w", filePath, err)
+	}
+
+	fingerprint := moduleFactsFingerprint(content)
+	facts, lineCount, err := ma.moduleFactsForFingerprint(content, fingerprint, filePath)
+	if err != nil {
+		return moduleFacts{}, 0, err
+	}
+	if info != nil {
+		ma.factsCache.recordStat(filePath, info, fingerprint)
+	}
+	return facts, lineCount, nil
+}
+
+// moduleFactsForFingerprint returns the facts and line count for a file's
+// content, parsing it only when the facts cache has no entry for the same
+// content fingerprint.
+func (ma *ModuleAnalyzer) moduleFactsForFingerprint(content []byte, fingerprint, filePath string) (moduleFacts, int, error) {
+	if facts, lineCount, ok := ma.factsCache.lookup(fingerprint); ok {
+		return facts, lineCount, nil
+	}
+
+	p := parser.New()
+	result, err := p.Parse(context.Background(), content)
+	if err != nil {
+		return moduleFacts{}, 0, fmt.Errorf("failed to parse file %s: %w", filePath, err)
+	}
+
+	facts := ma.collectModuleFacts(result.AST)
+	lineCount := countSourceLines(content)
+	ma.factsCache.store(fingerprint, facts, lineCount)
+	return facts, lineCount, nil
+}
+
 func (ma *ModuleAnalyzer) dependencyEdgeType(imp *ImportInfo) DependencyEdgeType {
 	if imp.IsRelative {
 		return DependencyEdgeRelative
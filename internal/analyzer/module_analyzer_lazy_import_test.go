@@ -159,7 +159,7 @@ def use():
 		t.Errorf("foo.a -> foo.b (top-level import) should NOT be flagged lazy")
 	}
 
-	loadTimeGraph := loadTimeDependencyGraph{graph}
+	loadTimeGraph := newLoadTimeDependencyGraph(graph)
 	if successors := loadTimeGraph.Successors("foo.b"); len(successors) != 0 {
 		t.Errorf("load-time successors of foo.b = %v, want none", successors)
 	}
@@ -0,0 +1,261 @@
+package analyzer
+
+import (
+	"crypto/sha256"
+	"encoding/hex"
+	"encoding/json"
+	"os"
+	"path/filepath"
+	"sync"
+	"testing"
+	"time"
+
+	"github.com/ludo-technologies/pyscn/internal/version"
+)
+
+// moduleFactsCacheVersion must be bumped whenever the facts extracted by
+// collectModuleFacts change shape or meaning, so stale entries are discarded.
+const moduleFactsCacheVersion = 2
+
+// moduleFactsRacyWindow is how recently a file may have been modified before
+// its stat stamp is no longer trusted: a write landing within the file
+// system's timestamp granularity could otherwise leave size and mtime intact.
+const moduleFactsRacyWindow = 2 * time.Second
+
+// cachedModuleFacts is the persisted form of moduleFacts for one file content.
+type cachedModuleFacts struct {
+	Imports            []*ImportInfo `json:"imports,omitempty"`
+	FunctionCount      int           `json:"function_count"`
+	ClassCount         int           `json:"class_count"`
+	AbstractClassCount int           `json:"abstract_class_count"`
+	PublicNames        []string      `json:"public_names,omitempty"`
+	LineCount          int           `json:"line_count"`
+}
+
+// fileStamp remembers the content fingerprint of a file as of the given size
+// and modification time, so unchanged files are neither read nor hashed.
+type fileStamp struct {
+	Size        int64  `json:"size"`
+	ModTime     int64  `json:"mtime"`
+	Fingerprint string `json:"fingerprint"`
+}
+
+type moduleFactsCacheFile struct {
+	Version     int                           `json:"version"`
+	ToolVersion string                        `json:"tool_version"`
+	Entries     map[string]*cachedModuleFacts `json:"entries"`
+	Files       map[string]fileStamp          `json:"files,omitempty"`
+}
+
+// moduleFactsCache stores the facts ModuleAnalyzer extracts from each file,
+// keyed by a fingerprint of the file content rather than its path, so
+// unchanged and renamed files skip parsing on repeated runs. Files whose size
+// and modification time are unchanged also skip reading and hashing. A nil
+// cache is valid and behaves as an always-empty cache. Safe for concurrent use.
+type moduleFactsCache struct {
+	mu        sync.Mutex
+	path      string
+	entries   map[string]*cachedModuleFacts // Loaded from disk
+	used      map[string]*cachedModuleFacts // Looked up or stored during this run
+	files     map[string]fileStamp          // Loaded from disk
+	usedFiles map[string]fileStamp          // Confirmed or recorded during this run
+	dirty     bool
+}
+
+// moduleFactsCachePath returns the per-project cache file path.
+func moduleFactsCachePath(projectRoot string) (string, error) {
+	cacheDir, err := os.UserCacheDir()
+	if err != nil {
+		return "", err
+	}
+	sum := sha256.Sum256([]byte(projectRoot))
+	name := hex.EncodeToString(sum[:8]) + ".json"
+	return filepath.Join(cacheDir, "pyscn", "modules", name), nil
+}
+
+// loadModuleFactsCache opens the cache for projectRoot. Returns nil when no
+// cache location is available, and under `go test` so test runs neither read
+// nor pollute the user's cache.
+func loadModuleFactsCache(projectRoot string) *moduleFactsCache {
+	if testing.Testing() {
+		return nil
+	}
+	path, err := moduleFactsCachePath(projectRoot)
+	if err != nil {
+		return nil
+	}
+	return newModuleFactsCache(path)
+}
+
+// newModuleFactsCache reads the cache stored at path. A missing, corrupt, or
+// outdated file yields an empty cache.
+func newModuleFactsCache(path string) *moduleFactsCache {
+	cache := &moduleFactsCache{
+		path:      path,
+		entries:   map[string]*cachedModuleFacts{},
+		used:      map[string]*cachedModuleFacts{},
+		files:     map[string]fileStamp{},
+		usedFiles: map[string]fileStamp{},
+	}
+
+	data, err := os.ReadFile(path)
+	if err != nil {
+		return cache
+	}
+	var file moduleFactsCacheFile
+	if err := json.Unmarshal(data, &file); err != nil ||
+		file.Version != moduleFactsCacheVersion ||
+		file.ToolVersion != version.Version ||
+		file.Entries == nil {
+		return cache
+	}
+	cache.entries = file.Entries
+	if file.Files != nil {
+		cache.files = file.Files
+	}
+	return cache
+}
+
+// moduleFactsFingerprint identifies a file by its content.
+func moduleFactsFingerprint(content []byte) string {
+	sum := sha256.Sum256(content)
+	return hex.EncodeToString(sum[:16])
+}
+
+// fingerprintForStat returns the fingerprint recorded for filePath when its
+// size and modification time still match, without touching its content.
+func (c *moduleFactsCache) fingerprintForStat(filePath string, info os.FileInfo) (string, bool) {
+	if c == nil {
+		return "", false
+	}
+	c.mu.Lock()
+	defer c.mu.Unlock()
+
+	stamp, ok := c.files[filePath]
+	if !ok || stamp.Size != info.Size() || stamp.ModTime != info.ModTime().UnixNano() {
+		return "", false
+	}
+	c.usedFiles[filePath] = stamp
+	return stamp.Fingerprint, true
+}
+
+// recordStat remembers the fingerprint of filePath for its current size and
+// modification time. Recently modified files are not recorded.
+func (c *moduleFactsCache) recordStat(filePath string, info os.FileInfo, fingerprint string) {
+	if c == nil || time.Since(info.ModTime()) < moduleFactsRacyWindow {
+		return
+	}
+	c.mu.Lock()
+	defer c.mu.Unlock()
+
+	stamp := fileStamp{
+		Size:        info.Size(),
+		ModTime:     info.ModTime().UnixNano(),
+		Fingerprint: fingerprint,
+	}
+	if prev, ok := c.files[filePath]; !ok || prev != stamp {
+		c.dirty = true
+	}
+	c.usedFiles[filePath] = stamp
+}
+
+// lookup returns the cached facts and line count for a content fingerprint.
+func (c *moduleFactsCache) lookup(fingerprint string) (moduleFacts, int, bool) {
+	if c == nil {
+		return moduleFacts{}, 0, false
+	}
+	c.mu.Lock()
+	defer c.mu.Unlock()
+
+	entry, ok := c.used[fingerprint]
+	if !ok {
+		entry, ok = c.entries[fingerprint]
+		if !ok {
+			return moduleFacts{}, 0, false
+		}
+		c.used[fingerprint] = entry
+	}
+
+	facts := moduleFacts{
+		imports:            cloneImportInfos(entry.Imports),
+		functionCount:      entry.FunctionCount,
+		classCount:         entry.ClassCount,
+		abstractClassCount: entry.AbstractClassCount,
+		publicNames:        append([]string(nil), entry.PublicNames...),
+	}
+	return facts, entry.LineCount, true
+}
+
+// store records freshly extracted facts for a content fingerprint.
+func (c *moduleFactsCache) store(fingerprint string, facts moduleFacts, lineCount int) {
+	if c == nil {
+		return
+	}
+	c.mu.Lock()
+	defer c.mu.Unlock()
+
+	c.used[fingerprint] = &cachedModuleFacts{
+		Imports:            cloneImportInfos(facts.imports),
+		FunctionCount:      facts.functionCount,
+		ClassCount:         facts.classCount,
+		AbstractClassCount: facts.abstractClassCount,
+		PublicNames:        append([]string(nil), facts.publicNames...),
+		LineCount:          lineCount,
+	}
+	c.dirty = true
+}
+
+// save writes the entries used during this run back to disk, dropping entries
+// for content that no longer exists in the project. Failures are ignored: the
+// cache only speeds up analysis and must never affect its result.
+func (c *moduleFactsCache) save() {
+	if c == nil {
+		return
+	}
+	c.mu.Lock()
+	defer c.mu.Unlock()
+
+	if !c.dirty && len(c.used) == len(c.entries) && len(c.usedFiles) == len(c.files) {
+		return
+	}
+	if err := os.MkdirAll(filepath.Dir(c.path), 0o755); err != nil {
+		return
+	}
+	data, err := json.Marshal(moduleFactsCacheFile{
+		Version:     moduleFactsCacheVersion,
+		ToolVersion: version.Version,
+		Entries:     c.used,
+		Files:       c.usedFiles,
+	})
+	if err != nil {
+		return
+	}
+
+	// Write through a temp file so concurrent runs never observe a partial cache
+	tmp, err := os.CreateTemp(filepath.Dir(c.path), filepath.Base(c.path)+".*.tmp")
+	if err != nil {
+		return
+	}
+	_, writeErr := tmp.Write(data)
+	closeErr := tmp.Close()
+	if writeErr != nil || closeErr != nil || os.Rename(tmp.Name(), c.path) != nil {
+		_ = os.Remove(tmp.Name())
+		return
+	}
+	c.entries = c.used
+	c.files = c.usedFiles
+	c.dirty = false
+}
+
+func cloneImportInfos(imports []*ImportInfo) []*ImportInfo {
+	if len(imports) == 0 {
+		return nil
+	}
+	cloned := make([]*ImportInfo, len(imports))
+	for i, imp := range imports {
+		copied := *imp
+		copied.ImportedNames = append([]string(nil), imp.ImportedNames...)
+		cloned[i] = &copied
+	}
+	return cloned
+}
@@ -0,0 +1,196 @@
+package analyzer
+
+import (
+	"fmt"
+	"os"
+	"path/filepath"
+	"testing"
+	"time"
+
+	"github.com/ludo-technologies/pyscn/domain"
+)
+
+func TestModuleFactsCacheRoundTrip(t *testing.T) {
+	path := filepath.Join(t.TempDir(), "modules.json")
+	content := []byte("import os\nfrom .b import thing\n")
+	fingerprint := moduleFactsFingerprint(content)
+
+	cache := newModuleFactsCache(path)
+	if _, _, ok := cache.lookup(fingerprint); ok {
+		t.Fatalf("expected empty cache to miss")
+	}
+
+	facts := moduleFacts{
+		imports: []*ImportInfo{
+			{Statement: "import os", ImportedNames: []string{"os"}, Line: 1},
+			{Statement: "b", ImportedNames: []string{"thing"}, IsRelative: true, Level: 1, Line: 2},
+		},
+		functionCount: 2,
+		classCount:    1,
+		publicNames:   []string{"Thing"},
+	}
+	cache.store(fingerprint, facts, 3)
+	cache.save()
+
+	reloaded := newModuleFactsCache(path)
+	got, lineCount, ok := reloaded.lookup(fingerprint)
+	if !ok {
+		t.Fatalf("expected reloaded cache to hit")
+	}
+	if lineCount != 3 || got.functionCount != 2 || got.classCount != 1 {
+		t.Errorf("unexpected cached facts: lines=%d functions=%d classes=%d", lineCount, got.functionCount, got.classCount)
+	}
+	if len(got.imports) != 2 || !got.imports[1].IsRelative || got.imports[1].ImportedNames[0] != "thing" {
+		t.Errorf("unexpected cached imports: %+v", got.imports)
+	}
+
+	// Lookups hand out copies so graph edges never share cached ImportInfo
+	got.imports[0].Statement = "mutated"
+	again, _, _ := reloaded.lookup(fingerprint)
+	if again.imports[0].Statement != "import os" {
+		t.Errorf("cached entry was mutated through a lookup result")
+	}
+}
+
+func TestModuleFactsCacheDropsUnusedEntries(t *testing.T) {
+	path := filepath.Join(t.TempDir(), "modules.json")
+
+	cache := newModuleFactsCache(path)
+	cache.store("stale", moduleFacts{}, 1)
+	cache.store("kept", moduleFacts{}, 1)
+	cache.save()
+
+	next := newModuleFactsCache(path)
+	if _, _, ok := next.lookup("kept"); !ok {
+		t.Fatalf("expected entry to survive reload")
+	}
+	next.save()
+
+	final := newModuleFactsCache(path)
+	if _, _, ok := final.lookup("stale"); ok {
+		t.Errorf("expected entry unused in the previous run to be pruned")
+	}
+}
+
+func TestModuleFactsCacheIgnoresOutdatedFile(t *testing.T) {
+	path := filepath.Join(t.TempDir(), "modules.json")
+	data := `{"version":0,"tool_version":"old","entries":{"abc":{"line_count":1}}}`
+	if err := os.WriteFile(path, []byte(data), 0o644); err != nil {
+		t.Fatalf("failed to write cache file: %v", err)
+	}
+
+	if _, _, ok := newModuleFactsCache(path).lookup("abc"); ok {
+		t.Errorf("expected outdated cache file to be ignored")
+	}
+}
+
+func TestModuleAnalyzerUsesCachedFacts(t *testing.T) {
+	tmpDir := t.TempDir()
+	content := []byte("import b\n")
+
+	ma, err := NewModuleAnalyzer(&ModuleAnalysisOptions{
+		ProjectRoot:       tmpDir,
+		IncludeThirdParty: domain.BoolPtr(false),
+	})
+	if err != nil {
+		t.Fatalf("failed to create module analyzer: %v", err)
+	}
+
+	// Seed the cache with facts that differ from the file so a hit is observable
+	ma.factsCache = newModuleFactsCache(filepath.Join(tmpDir, "cache.json"))
+	ma.factsCache.store(moduleFactsFingerprint(content), moduleFacts{functionCount: 7}, 42)
+
+	file := filepath.Join(tmpDir, "a.py")
+	if err := os.WriteFile(file, content, 0o644); err != nil {
+		t.Fatalf("failed to write file: %v", err)
+	}
+
+	facts, lineCount, err := ma.moduleFactsForFile(file)
+	if err != nil {
+		t.Fatalf("unexpected error: %v", err)
+	}
+	if facts.functionCount != 7 || lineCount != 42 {
+		t.Errorf("expected cached facts, got functions=%d lines=%d", facts.functionCount, lineCount)
+	}
+}
+
+func TestModuleFactsCacheStatStamps(t *testing.T) {
+	tmpDir := t.TempDir()
+	file := filepath.Join(tmpDir, "a.py")
+	if err := os.WriteFile(file, []byte("import b\n"), 0o644); err != nil {
+		t.Fatalf("failed to write file: %v", err)
+	}
+	old := time.Now().Add(-time.Hour)
+	if err := os.Chtimes(file, old, old); err != nil {
+		t.Fatalf("failed to set file times: %v", err)
+	}
+	info, err := os.Stat(file)
+	if err != nil {
+		t.Fatalf("failed to stat file: %v", err)
+	}
+
+	path := filepath.Join(tmpDir, "cache.json")
+	cache := newModuleFactsCache(path)
+	cache.recordStat(file, info, "fp")
+	cache.save()
+
+	reloaded := newModuleFactsCache(path)
+	if fingerprint, ok := reloaded.fingerprintForStat(file, info); !ok || fingerprint != "fp" {
+		t.Fatalf("expected stat stamp to hit, got %q %v", fingerprint, ok)
+	}
+
+	// Any change to size or mtime invalidates the stamp
+	if err := os.WriteFile(file, []byte("import b, c\n"), 0o644); err != nil {
+		t.Fatalf("failed to rewrite file: %v", err)
+	}
+	changed, err := os.Stat(file)
+	if err != nil {
+		t.Fatalf("failed to stat file: %v", err)
+	}
+	if _, ok := reloaded.fingerprintForStat(file, changed); ok {
+		t.Errorf("expected modified file to miss")
+	}
+
+	// Freshly modified files are not stamped
+	fresh := newModuleFactsCache(path)
+	fresh.recordStat(file, changed, "fp2")
+	if _, ok := fresh.usedFiles[file]; ok {
+		t.Errorf("expected recently modified file not to be recorded")
+	}
+}
+
+func TestLoadModuleFactsKeepsInputOrder(t *testing.T) {
+	tmpDir := t.TempDir()
+	ma, err := NewModuleAnalyzer(&ModuleAnalysisOptions{
+		ProjectRoot:       tmpDir,
+		IncludeThirdParty: domain.BoolPtr(false),
+	})
+	if err != nil {
+		t.Fatalf("failed to create module analyzer: %v", err)
+	}
+
+	// Enough files to take the parallel path; file i defines i functions
+	var files []string
+	for i := 0; i < parallelModuleFactsMinFiles+8; i++ {
+		var content string
+		for j := 0; j < i; j++ {
+			content += fmt.Sprintf("def f%d():\n    pass\n", j)
+		}
+		file := filepath.Join(tmpDir, fmt.Sprintf("m%d.py", i))
+		if err := os.WriteFile(file, []byte(content), 0o644); err != nil {
+			t.Fatalf("failed to write file: %v", err)
+		}
+		files = append(files, file)
+	}
+	files = append(files, filepath.Join(tmpDir, "missing.py"))
+
+	results := ma.loadModuleFacts(files)
+	for i, loaded := range results[:len(results)-1] {
+		if loaded.err != nil || loaded.facts.functionCount != i {
+			t.Errorf("file %d: functions=%d err=%v", i, loaded.facts.functionCount, loaded.err)
+		}
+	}
+	if results[len(results)-1].err == nil {
+		t.Errorf("expected an error for a missing file")
+	}
+}
@@ -16,6 +16,26 @@ type SemanticSimilarityAnalyzer struct {
 	cfgFeatureWeight float64 // Weight for CFG features (default: 0.6)
 	dfaFeatureWeight float64 // Weight for DFA features (default: 0.4)
 	minCyclomatic    int     // Minimum cyclomatic complexity V(G) required on both sides
+
+	// profiles caches per-fragment features so each fragment is analyzed once
+	// no matter how many pairs it takes part in, bounded so memory stays flat
+	// on large projects. Not safe for concurrent use; clone detector workers
+	// each own their analyzer.
+	profiles *lruCache[*CodeFragment, *semanticProfile]
+}
+
+// semanticProfileCacheSize bounds the number of fragment profiles kept in
+// memory. Evicted profiles are rebuilt on demand and yield the same scores.
+const semanticProfileCacheSize = 4096
+
+// semanticProfile holds the features ComputeSimilarity needs from one fragment.
+type semanticProfile struct {
+	valid       bool         // False when no CFG could be built
+	cfgFeatures *CFGFeatures // Structural CFG features
+	dfaFeatures *DFAFeatures // Data flow features; nil when DFA is disabled
+
+	signals    coresemantic.SemanticSignals // Extracted lazily, see semanticSignals
+	hasSignals bool
 }
 
 // NewSemanticSimilarityAnalyzer creates a new semantic similarity analyzer
@@ -40,6 +60,9 @@ func NewSemanticSimilarityAnalyzerWithDFA() *SemanticSimilarityAnalyzer {
 
 // SetEnableDFA enables or disables DFA analysis
 func (s *SemanticSimilarityAnalyzer) SetEnableDFA(enable bool) {
+	if s.enableDFA != enable {
+		s.profiles = nil // Cached profiles may lack DFA features
+	}
 	s.enableDFA = enable
 }
 
@@ -73,17 +96,13 @@ func (s *SemanticSimilarityAnalyzer) ComputeSimilarity(f1, f2 *CodeFragment) flo
 		return 0.0
 	}
 
-	// Build CFGs for both fragments
-	cfg1, err1 := s.buildCFGFromFragment(f1)
-	cfg2, err2 := s.buildCFGFromFragment(f2)
-
-	if err1 != nil || err2 != nil || cfg1 == nil || cfg2 == nil {
+	p1 := s.profile(f1)
+	p2 := s.profile(f2)
+	if !p1.valid || !p2.valid {
 		return 0.0
 	}
-
-	// Extract CFG features from both CFGs
-	cfgFeatures1 := s.extractCFGFeatures(cfg1)
-	cfgFeatures2 := s.extractCFGFeatures(cfg2)
+	cfgFeatures1 := p1.cfgFeatures
+	cfgFeatures2 := p2.cfgFeatures
 
 	// Control-flow gate; see domain.DefaultSemanticMinCyclomaticComplexity for
 	// rationale. Rejected fragments remain eligible for Type-1/2/3 upstream.
@@ -96,36 +115,64 @@ func (s *SemanticSimilarityAnalyzer) ComputeSimilarity(f1, f2 *CodeFragment) flo
 
 	// If DFA is not enabled, return CFG similarity only
 	if !s.enableDFA {
-		return s.applySemanticEvidence(cfgSimilarity, f1, f2)
+		return s.applySemanticEvidence(cfgSimilarity, f1, p1, f2, p2)
 	}
 
-	// Build DFA info for both CFGs
-	dfaBuilder := NewDFABuilder()
-	dfaInfo1, _ := dfaBuilder.Build(cfg1)
-	dfaInfo2, _ := dfaBuilder.Build(cfg2)
-
-	// Extract DFA features
-	dfaFeatures1 := ExtractDFAFeatures(dfaInfo1)
-	dfaFeatures2 := ExtractDFAFeatures(dfaInfo2)
-
 	// Compare DFA features
-	dfaSimilarity := s.compareDFAFeatures(dfaFeatures1, dfaFeatures2)
+	dfaSimilarity := s.compareDFAFeatures(p1.dfaFeatures, p2.dfaFeatures)
 
 	// Combine CFG and DFA similarities with configured weights.
 	baseSimilarity := s.cfgFeatureWeight*cfgSimilarity + s.dfaFeatureWeight*dfaSimilarity
-	return s.applySemanticEvidence(baseSimilarity, f1, f2)
+	return s.applySemanticEvidence(baseSimilarity, f1, p1, f2, p2)
+}
+
+// profile returns the cached semantic profile of a fragment, building its CFG
+// (and DFA, when enabled) on first use.
+func (s *SemanticSimilarityAnalyzer) profile(f *CodeFragment) *semanticProfile {
+	if s.profiles == nil {
+		s.profiles = newLRUCache[*CodeFragment, *semanticProfile](semanticProfileCacheSize)
+	}
+	if p, ok := s.profiles.get(f); ok {
+		return p
+	}
+
+	p := &semanticProfile{}
+	s.profiles.add(f, p)
+
+	cfg, err := s.buildCFGFromFragment(f)
+	if err != nil || cfg == nil {
+		return p
+	}
+	p.valid = true
+	p.cfgFeatures = s.extractCFGFeatures(cfg)
+
+	if s.enableDFA {
+		dfaInfo, _ := NewDFABuilder().Build(cfg)
+		p.dfaFeatures = ExtractDFAFeatures(dfaInfo)
+	}
+	return p
+}
+
+// semanticSignals returns the fragment's Python semantic signals, extracting
+// them only for fragments that reach the evidence stage.
+func (p *semanticProfile) semanticSignals(f *CodeFragment) coresemantic.SemanticSignals {
+	if !p.hasSignals {
+		p.signals = extractSemanticSignals(f.ASTNode)
+		p.hasSignals = true
+	}
+	return p.signals
 }
 
 // applySemanticEvidence extracts Python semantic signals from both fragments
 // and delegates the evidence penalties (disjoint literals, missing shared
 // strong signals, incompatible return categories) to core.
-func (s *SemanticSimilarityAnalyzer) applySemanticEvidence(baseSimilarity float64, f1, f2 *CodeFragment) float64 {
+func (s *SemanticSimilarityAnalyzer) applySemanticEvidence(baseSimilarity float64, f1 *CodeFragment, p1 *semanticProfile, f2 *CodeFragment, p2 *semanticProfile) float64 {
 	if baseSimilarity == 0.0 {
 		return 0.0
 	}
 
-	signals1 := extractSemanticSignals(f1.ASTNode)
-	signals2 := extractSemanticSignals(f2.ASTNode)
+	signals1 := p1.semanticSignals(f1)
+	signals2 := p2.semanticSignals(f2)
 	return coresemantic.ApplySemanticEvidence(baseSimilarity, signals1, signals2)
 }
 
@@ -50,3 +50,27 @@ func TestType4SimilarityScores(t *testing.T) {
 		assert.Less(t, similarity, config.Type4Threshold, "%s <-> %s", negative[0], negative[1])
 	}
 }
+
+func TestSemanticProfilesAreBuiltOncePerFragment(t *testing.T) {
+	detector := NewCloneDetector(DefaultCloneDetectorConfig())
+	_, functions := loadType4FunctionFragments(t, detector)
+	first := functions["sum_iterative.py::sum_numbers"]
+	second := functions["sum_recursive.py::sum_numbers"]
+	third := functions["find_max_a.py::find_maximum"]
+	require.NotNil(t, first)
+	require.NotNil(t, second)
+	require.NotNil(t, third)
+
+	analyzer := NewSemanticSimilarityAnalyzerWithDFA()
+	similarity := analyzer.ComputeSimilarity(first, second)
+	analyzer.ComputeSimilarity(first, third)
+	analyzer.ComputeSimilarity(second, third)
+	assert.Equal(t, 3, analyzer.profiles.order.Len())
+
+	// Cached profiles must not change the score
+	assert.Equal(t, similarity, analyzer.ComputeSimilarity(first, second))
+	assert.Equal(t, similarity, NewSemanticSimilarityAnalyzerWithDFA().ComputeSimilarity(first, second))
+
+	analyzer.SetEnableDFA(false)
+	assert.Nil(t, analyzer.profiles)
+}
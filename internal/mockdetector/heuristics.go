@@ -4,6 +4,7 @@ package mockdetector
 import (
 	"regexp"
 	"strings"
+	"unicode/utf8"
 
 	"github.com/ludo-technologies/pyscn/domain"
 )
@@ -91,16 +92,19 @@ type Match struct {
 }
 
 // CheckString checks a string value for mock data patterns.
+// Each regex rule is guarded by a cheap literal check that every match of the
+// rule must satisfy, so most string literals never reach the regex engine.
 func (h *Heuristics) CheckString(value string) []Match {
 	var matches []Match
+	lower := strings.ToLower(value)
 
 	// Check for keyword matches in the string
-	if match := h.checkKeywords(value); match != nil {
+	if match := h.checkKeywords(value, lower); match != nil {
 		matches = append(matches, *match)
 	}
 
 	// Check for domain matches
-	if match := h.checkDomains(value); match != nil {
+	if match := h.checkDomains(value, lower); match != nil {
 		matches = append(matches, *match)
 	}
 
@@ -154,8 +158,7 @@ func (h *Heuristics) CheckIdentifier(name string) []Match {
 }
 
 // checkKeywords checks for keyword patterns in a string.
-func (h *Heuristics) checkKeywords(value string) *Match {
-	lower := strings.ToLower(value)
+func (h *Heuristics) checkKeywords(value, lower string) *Match {
 	for _, keyword := range h.Keywords {
 		if containsWordBoundary(lower, keyword) {
 			return &Match{
@@ -206,8 +209,7 @@ func isAlphaNum(b byte) bool {
 }
 
 // checkDomains checks for test/mock domain patterns.
-func (h *Heuristics) checkDomains(value string) *Match {
-	lower := strings.ToLower(value)
+func (h *Heuristics) checkDomains(value, lower string) *Match {
 	for _, d := range h.Domains {
 		if strings.Contains(lower, d) {
 			return &Match{
@@ -224,7 +226,8 @@ func (h *Heuristics) checkDomains(value string) *Match {
 
 // checkEmail checks for test/mock email addresses.
 func (h *Heuristics) checkEmail(value string) *Match {
-	if h.emailPattern.MatchString(value) {
+	// Every match contains '@'
+	if strings.IndexByte(value, '@') >= 0 && h.emailPattern.MatchString(value) {
 		return &Match{
 			Value:       value,
 			Type:        domain.MockDataTypeEmail,
@@ -238,7 +241,8 @@ func (h *Heuristics) checkEmail(value string) *Match {
 
 // checkPhone checks for placeholder phone numbers.
 func (h *Heuristics) checkPhone(value string) *Match {
-	if h.phonePattern.MatchString(value) {
+	// Every match starts with 000, 111, or 123
+	if strings.ContainsAny(value, "01") && h.phonePattern.MatchString(value) {
 		return &Match{
 			Value:       value,
 			Type:        domain.MockDataTypePhone,
@@ -252,7 +256,8 @@ func (h *Heuristics) checkPhone(value string) *Match {
 
 // checkUUID checks for low-entropy UUIDs.
 func (h *Heuristics) checkUUID(value string) *Match {
-	if !h.uuidPattern.MatchString(value) {
+	// A UUID is 36 bytes long and contains '-'
+	if len(value) < 36 || strings.IndexByte(value, '-') < 0 || !h.uuidPattern.MatchString(value) {
 		return nil
 	}
 
@@ -370,7 +375,7 @@ func isRepetitive(s string) bool {
 
 // checkCredential checks for test credentials.
 func (h *Heuristics) checkCredential(value string) *Match {
-	if h.credentialPattern.MatchString(value) {
+	if mayBeCredential(value) && h.credentialPattern.MatchString(value) {
 		return &Match{
 			Value:       value,
 			Type:        domain.MockDataTypeTestCredential,
@@ -382,6 +387,24 @@ func (h *Heuristics) checkCredential(value string) *Match {
 	return nil
 }
 
+// mayBeCredential reports whether value can match credentialPattern. Every
+// alternative is anchored and starts with p, s, a, t, or c; non-ASCII leading
+// bytes are let through because (?i) also folds some non-ASCII runes.
+func mayBeCredential(value string) bool {
+	if value == "" {
+		return false
+	}
+	if value[0] >= utf8.RuneSelf {
+		return true
+	}
+	switch value[0] | 0x20 { // ASCII lowercase
+	case 'p', 's', 'a', 't', 'c':
+		return true
+	default:
+		return false
+	}
+}
+
 // CheckComment checks a comment for placeholder markers.
 func (h *Heuristics) CheckComment(comment string) *Match {
 	if h.placeholderPattern.MatchString(comment) {
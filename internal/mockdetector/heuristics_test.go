@@ -208,6 +208,8 @@ func TestHeuristics_CheckString_Credential(t *testing.T) {
 		{"secret123", "secret123", true},
 		{"testpassword", "testpassword", true},
 		{"api_key", "api_key", true},
+		{"uppercase password", "Password123", true},
+		{"uppercase token", "TOKEN", true},
 		{"real password", "xK9#mP2$vL8@nQ4", false},
 	}
 
@@ -252,10 +252,14 @@ create_wheel() {
         if [[ "$has_mcp_binary" -eq 1 ]]; then
             cp "$src_dir/mcp_main.py" "$pkg_dir/"
         fi
+        # Bake the version in so importing the package does not need to
+        # scan installed distributions via importlib.metadata
+        echo "__version__ = \"$VERSION\"" > "$pkg_dir/_version.py"
     elif [[ "$PACKAGE_NAME" == "pyscn_mcp" ]]; then
         src_dir="$(dirname "$0")/../src/pyscn_mcp"
         cp "$src_dir/__init__.py" "$pkg_dir/"
         cp "$src_dir/__main__.py" "$pkg_dir/"
+        echo "__version__ = \"$VERSION\"" > "$pkg_dir/_version.py"
     fi
     
     # Copy binaries
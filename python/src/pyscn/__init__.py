@@ -5,16 +5,18 @@ This package provides a Python wrapper for the pyscn binary,
 which is implemented in Go for high performance.
 """
 
-from importlib.metadata import version, PackageNotFoundError
-
 try:
-    __version__ = version("pyscn")
-except PackageNotFoundError:
-    __version__ = "0.0.0"
+    # Written at build time by setuptools_scm / create_wheel.sh
+    from ._version import __version__
+except ImportError:
+    from importlib.metadata import version, PackageNotFoundError
+
+    try:
+        __version__ = version("pyscn")
+    except PackageNotFoundError:
+        __version__ = "0.0.0"
 
 __author__ = "pyscn team"
 __email__ = "team@pyscn.dev"
 
 from .main import main
-
-__all__ = ["main"]
\ No newline at end of file
@@ -4,4 +4,13 @@ pyscn-mcp: MCP (Model Context Protocol) server for pyscn Python code analyzer.
 This package provides an MCP server interface to pyscn's code analysis capabilities.
 """
 
-__version__ = "0.0.0"  # Will be set by setuptools_scm
+try:
+    # Written at build time by create_wheel.sh
+    from ._version import __version__
+except ImportError:
+    from importlib.metadata import version, PackageNotFoundError
+
+    try:
+        __version__ = version("pyscn-mcp")
+    except PackageNotFoundError:
+        __version__ = "0.0.0"
@@ -0,0 +1,15 @@
+"""Tests for the pyscn package exports."""
+
+import importlib
+
+
+def test_main_export_is_callable_after_cli_entry_import():
+    # The console script and `python -m pyscn` both import pyscn.__main__,
+    # which imports the pyscn.main submodule; the export must still win.
+    importlib.import_module("pyscn.__main__")
+    pyscn = importlib.import_module("pyscn")
+
+    assert callable(pyscn.main)
+    from pyscn import main
+
+    assert main is pyscn.main
@@ -1628,6 +1628,7 @@ func minSystemAnalysis(a, b int) int {
 // extractModuleMetrics extracts module dependency metrics from the graph
 func (s *SystemAnalysisServiceImpl) extractModuleMetrics(graph *analyzer.DependencyGraph) map[string]*domain.ModuleDependencyMetrics {
 	result := make(map[string]*domain.ModuleDependencyMetrics)
+	reachability := analyzer.NewDependencyReachability(graph)
 
 	for moduleName, node := range graph.Nodes {
 		// Get analyzer metrics if available
@@ -1652,7 +1653,7 @@ func (s *SystemAnalysisServiceImpl) extractModuleMetrics(graph *analyzer.Depende
 
 			// Dependencies
 			DirectDependencies:     s.getDirectDependencies(moduleName, node),
-			TransitiveDependencies: s.getTransitiveDependencies(graph, moduleName),
+			TransitiveDependencies: reachability.TransitiveDependencies(moduleName),
 			Dependents:             s.getDependents(graph, moduleName),
 		}
 
@@ -1699,39 +1700,6 @@ func (s *SystemAnalysisServiceImpl) getDirectDependencies(moduleName string, nod
 	return deps
 }
 
-// getTransitiveDependencies returns all transitive dependencies of a module
-func (s *SystemAnalysisServiceImpl) getTransitiveDependencies(graph *analyzer.DependencyGraph, moduleName string) []string {
-	visited := make(map[string]bool)
-	s.collectTransitiveDependencies(graph, moduleName, visited)
-
-	// Remove the module itself from visited
-	delete(visited, moduleName)
-
-	var deps []string
-	for dep := range visited {
-		deps = append(deps, dep)
-	}
-	sort.Strings(deps)
-	return deps
-}
-
-// collectTransitiveDependencies recursively collects all transitive dependencies
-func (s *SystemAnalysisServiceImpl) collectTransitiveDependencies(graph *analyzer.DependencyGraph, moduleName string, visited map[string]bool) {
-	if visited[moduleName] {
-		return
-	}
-	visited[moduleName] = true
-
-	node, exists := graph.Nodes[moduleName]
-	if !exists {
-		return
-	}
-
-	for dep := range node.Dependencies {
-		s.collectTransitiveDependencies(graph, dep, visited)
-	}
-}
-
 // getDependents returns the modules that depend on the given module
 func (s *SystemAnalysisServiceImpl) getDependents(graph *analyzer.DependencyGraph, moduleName string) []string {
 	var dependents []string
@@ -1,5 +1,7 @@
 # Comprehension patterns
 
+import math
+
 # List comprehensions
 simple_list = [x for x in range(10)]
 squared_list = [x**2 for x in range(10)]
@@ -52,7 +54,7 @@ complex_gen = (
 def is_prime(n):
     if n < 2:
         return False
-    for i in range(2, int(n**0.5) + 1):
+    for i in range(2, math.isqrt(n) + 1):
         if n % i == 0:
             return False
     return True
@@ -1,14 +1,20 @@
 # Decorator patterns
 
 import functools
+import os
 from typing import Any, Callable
 
+# Wrapper tracing is opt-in so decorated calls stay free of I/O by default
+_TRACE = bool(os.environ.get("PYSCN_TRACE"))
+
 # Simple decorator
 def simple_decorator(func):
     def wrapper(*args, **kwargs):
-        print(f"Before {func.__name__}")
+        if __debug__ and _TRACE:
+            print(f"Before {func.__name__}")
         result = func(*args, **kwargs)
-        print(f"After {func.__name__}")
+        if __debug__ and _TRACE:
+            print(f"After {func.__name__}")
         return result
     return wrapper
 
@@ -107,13 +113,16 @@ class MethodDecorators:
 
 # Decorator class
 class CountCalls:
+    __slots__ = ('func', 'count')
+
     def __init__(self, func):
         self.func = func
         self.count = 0
     
     def __call__(self, *args, **kwargs):
         self.count += 1
-        print(f"Call {self.count} to {self.func.__name__}")
+        if __debug__ and _TRACE:
+            print(f"Call {self.count} to {self.func.__name__}")
         return self.func(*args, **kwargs)
 
 @CountCalls
@@ -126,13 +135,14 @@ class MaxCalls:
         self.max_calls = max_calls
     
     def __call__(self, func):
-        self.calls = 0
+        max_calls = self.max_calls
+        calls = [0]
         
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            if self.calls >= self.max_calls:
-                raise Exception(f"Max calls ({self.max_calls}) exceeded")
-            self.calls += 1
+            if calls[0] >= max_calls:
+                raise Exception(f"Max calls ({max_calls}) exceeded")
+            calls[0] += 1
             return func(*args, **kwargs)
         
         return wrapper
@@ -146,18 +156,22 @@ from contextlib import contextmanager
 
 @contextmanager
 def my_context():
-    print("Entering context")
+    if __debug__ and _TRACE:
+        print("Entering context")
     try:
         yield "context value"
     finally:
-        print("Exiting context")
+        if __debug__ and _TRACE:
+            print("Exiting context")
 
 # Async decorator
 def async_decorator(func):
     async def wrapper(*args, **kwargs):
-        print(f"Before async {func.__name__}")
+        if __debug__ and _TRACE:
+            print(f"Before async {func.__name__}")
         result = await func(*args, **kwargs)
-        print(f"After async {func.__name__}")
+        if __debug__ and _TRACE:
+            print(f"After async {func.__name__}")
         return result
     return wrapper
 
@@ -170,6 +184,8 @@ def validate_type(expected_type):
     def decorator(func):
         @functools.wraps(func)
         def wrapper(value):
+            if type(value) is expected_type:
+                return func(value)
             if not isinstance(value, expected_type):
                 raise TypeError(f"Expected {expected_type}, got {type(value)}")
             return func(value)
@@ -12,6 +12,10 @@ class GoodService:
 class BadService:
     """A class with too many constructor parameters - DI anti-pattern."""
 
+    __slots__ = ('user_repo', 'order_repo', 'product_repo',
+                 'payment_service', 'notification_service', 'email_service',
+                 'cache', 'logger', 'config')
+
     def __init__(self, user_repo, order_repo, product_repo,
                  payment_service, notification_service, email_service,
                  cache, logger, config):
@@ -40,6 +44,8 @@ class ExactlyAtThreshold:
 class JustOverThreshold:
     """A class with 6 parameters (just over threshold)."""
 
+    __slots__ = ('repo1', 'repo2', 'service1', 'service2', 'logger', 'config')
+
     def __init__(self, repo1, repo2, service1, service2, logger, config):
         self.repo1 = repo1
         self.repo2 = repo2
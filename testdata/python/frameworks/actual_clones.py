@@ -14,7 +14,7 @@ from datetime import datetime
 # Type-1/Type-2 Clone: Nearly identical dataclasses with only name differences
 # These SHOULD be detected as clones - they have identical logic
 
-@dataclass
+@dataclass(slots=True)
 class UserMetricsV1:
     """First version of user metrics - actual clone of UserMetricsV2."""
     user_id: str
@@ -25,11 +25,11 @@ class UserMetricsV1:
 
     def calculate_engagement_score(self) -> float:
         """Calculate user engagement score."""
-        if self.login_count == 0:
+        login_count = self.login_count
+        if login_count == 0:
             return 0.0
-        avg_session = self.session_duration_seconds / self.login_count
-        avg_pages = self.page_views / self.login_count
-        return (avg_session * 0.3 + avg_pages * 0.7) / 100.0
+        weighted = self.session_duration_seconds * 0.3 + self.page_views * 0.7
+        return weighted / (login_count * 100.0)
 
     def record_session(self, duration: int, pages: int) -> None:
         """Record a new session."""
@@ -38,8 +38,17 @@ class UserMetricsV1:
         self.session_duration_seconds += duration
         self.page_views += pages
 
+    def record_sessions(self, sessions: list[tuple[int, int]]) -> None:
+        """Record a batch of (duration, pages) sessions with one clock read."""
+        if not sessions:
+            return
+        self.login_count += len(sessions)
+        self.last_login = datetime.now()
+        self.session_duration_seconds += sum(duration for duration, _ in sessions)
+        self.page_views += sum(pages for _, pages in sessions)
 
-@dataclass
+
+@dataclass(slots=True)
 class UserMetricsV2:
     """Second version of user metrics - actual clone of UserMetricsV1."""
     account_id: str  # Only name changed
@@ -50,11 +59,11 @@ class UserMetricsV2:
 
     def calculate_engagement_score(self) -> float:
         """Calculate user engagement score."""
-        if self.login_count == 0:
+        login_count = self.login_count
+        if login_count == 0:
             return 0.0
-        avg_session = self.session_duration_seconds / self.login_count
-        avg_pages = self.page_views / self.login_count
-        return (avg_session * 0.3 + avg_pages * 0.7) / 100.0
+        weighted = self.session_duration_seconds * 0.3 + self.page_views * 0.7
+        return weighted / (login_count * 100.0)
 
     def record_session(self, duration: int, pages: int) -> None:
         """Record a new session."""
@@ -63,6 +72,15 @@ class UserMetricsV2:
         self.session_duration_seconds += duration
         self.page_views += pages
 
+    def record_sessions(self, sessions: list[tuple[int, int]]) -> None:
+        """Record a batch of (duration, pages) sessions with one clock read."""
+        if not sessions:
+            return
+        self.login_count += len(sessions)
+        self.last_login = datetime.now()
+        self.session_duration_seconds += sum(duration for duration, _ in sessions)
+        self.page_views += sum(pages for _, pages in sessions)
+
 
 # Type-2/Type-3 Clone: Pydantic models with same validation logic
 # These SHOULD be detected as clones - validators are copy-pasted
@@ -77,16 +95,16 @@ class InternalUserRequest(BaseModel):
 
     def validate_and_normalize(self) -> dict:
         """Validate and return normalized data."""
-        normalized = {
+        email = self.email_address.strip().lower()
+        if not email.endswith(".com"):
+            raise ValueError("Invalid email domain")
+        return {
             "id": self.employee_id.strip().upper(),
             "name": self.full_name.strip().title(),
-            "email": self.email_address.strip().lower(),
+            "email": email,
             "dept": self.department.strip().upper(),
             "level": max(1, min(5, self.access_level)),
         }
-        if not normalized["email"].endswith(".com"):
-            raise ValueError("Invalid email domain")
-        return normalized
 
     def get_display_name(self) -> str:
         """Get formatted display name."""
@@ -103,16 +121,16 @@ class ExternalUserRequest(BaseModel):
 
     def validate_and_normalize(self) -> dict:
         """Validate and return normalized data."""
-        normalized = {
+        email = self.email_address.strip().lower()
+        if not email.endswith(".com"):
+            raise ValueError("Invalid email domain")
+        return {
             "id": self.customer_id.strip().upper(),
             "name": self.full_name.strip().title(),
-            "email": self.email_address.strip().lower(),
+            "email": email,
             "dept": self.company.strip().upper(),
             "level": max(1, min(5, self.tier_level)),
         }
-        if not normalized["email"].endswith(".com"):
-            raise ValueError("Invalid email domain")
-        return normalized
 
     def get_display_name(self) -> str:
         """Get formatted display name."""
@@ -132,17 +150,11 @@ class OrderProcessor:
 
     def apply_discount(self, discount_percent: float) -> float:
         """Apply discount - CLONED logic in PaymentProcessor."""
-        if discount_percent < 0:
-            discount_percent = 0
-        if discount_percent > 50:
-            discount_percent = 50
+        discount_percent = min(max(discount_percent, 0), 50)
 
         discount_amount = self.total_amount * (discount_percent / 100.0)
         self.discount_applied = discount_amount
-        final_amount = self.total_amount - discount_amount
-
-        if final_amount < 0:
-            final_amount = 0
+        final_amount = max(self.total_amount - discount_amount, 0)
 
         return round(final_amount, 2)
 
@@ -157,16 +169,10 @@ class PaymentProcessor:
 
     def apply_discount(self, discount_percent: float) -> float:
         """Apply discount - CLONED logic from OrderProcessor."""
-        if discount_percent < 0:
-            discount_percent = 0
-        if discount_percent > 50:
-            discount_percent = 50
+        discount_percent = min(max(discount_percent, 0), 50)
 
         discount_amount = self.subtotal * (discount_percent / 100.0)
         self.discount_value = discount_amount
-        final_amount = self.subtotal - discount_amount
-
-        if final_amount < 0:
-            final_amount = 0
+        final_amount = max(self.subtotal - discount_amount, 0)
 
         return round(final_amount, 2)
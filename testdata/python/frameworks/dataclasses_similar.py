@@ -9,6 +9,8 @@ from dataclasses import dataclass, field
 from typing import Optional, List
 from datetime import datetime
 
+_ERROR_LEVELS = frozenset({"ERROR", "CRITICAL", "FATAL"})
+
 
 @dataclass
 class UserProfile:
@@ -21,7 +23,12 @@ class UserProfile:
 
     def validate_email(self) -> bool:
         """Validate the email format."""
-        return "@" in self.email and "." in self.email.split("@")[1]
+        email = self.email
+        at = email.find("@")
+        if at < 0:
+            return False
+        end = email.find("@", at + 1)
+        return email.find(".", at + 1, end if end >= 0 else len(email)) >= 0
 
     def deactivate(self) -> None:
         """Deactivate the user profile."""
@@ -100,7 +107,8 @@ class LogEntry:
 
     def is_error(self) -> bool:
         """Check if this is an error log."""
-        return self.level.upper() in ("ERROR", "CRITICAL", "FATAL")
+        level = self.level
+        return level in _ERROR_LEVELS or level.upper() in _ERROR_LEVELS
 
     def format_entry(self) -> str:
         """Format the log entry as a string."""
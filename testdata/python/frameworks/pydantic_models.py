@@ -34,12 +34,11 @@ class CustomerAddress(BaseModel):
 
     def format_address(self) -> str:
         """Format address as a multi-line string."""
-        lines = [self.street_line1]
-        if self.street_line2:
-            lines.append(self.street_line2)
-        lines.append(f"{self.city}, {self.state} {self.postal_code}")
-        lines.append(self.country)
-        return "\n".join(lines)
+        line2 = f"{self.street_line2}\n" if self.street_line2 else ""
+        return (
+            f"{self.street_line1}\n{line2}"
+            f"{self.city}, {self.state} {self.postal_code}\n{self.country}"
+        )
 
 
 class PaymentTransaction(BaseModel):